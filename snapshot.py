@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import hashlib
 import io
 import itertools
 import json
 import math
+import os
+import sys
+import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
-import cartopy.crs as ccrs
-import cartopy.feature as cfeature
-import matplotlib.pyplot as plt
-from matplotlib.offsetbox import AnnotationBbox, OffsetImage
-from matplotlib.patches import ConnectionPatch, Rectangle
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -23,10 +27,20 @@ class Region:
     minimum_latitude: float
     maximum_latitude: float
 
+    def __post_init__(self) -> None:
+        # bounds are stored in order, so numerically equal regions compare and hash equal
+        if self.minimum_longitude > self.maximum_longitude:
+            longitude0, longitude1 = self.maximum_longitude, self.minimum_longitude
+            object.__setattr__(self, "minimum_longitude", longitude0)
+            object.__setattr__(self, "maximum_longitude", longitude1)
+        if self.minimum_latitude > self.maximum_latitude:
+            latitude0, latitude1 = self.maximum_latitude, self.minimum_latitude
+            object.__setattr__(self, "minimum_latitude", latitude0)
+            object.__setattr__(self, "maximum_latitude", latitude1)
+
     def normalized(self) -> "Region":
-        longitude0, longitude1 = sorted((self.minimum_longitude, self.maximum_longitude))
-        latitude0, latitude1 = sorted((self.minimum_latitude, self.maximum_latitude))
-        return Region(longitude0, longitude1, latitude0, latitude1)
+        # kept for compatibility only: every Region is normalized on construction, so this is a no-op
+        return self
 
     def as_extent(self) -> list[float]:
         return [self.minimum_longitude, self.maximum_longitude, self.minimum_latitude, self.maximum_latitude]
@@ -40,6 +54,7 @@ DEFAULT_ZOOM_REGION = Region(
     52.71198728589052,
 )
 DEFAULT_STAR = (52.6698042403715, -8.577276842533156)  # (latitute, longitude)
+DRAFT_DPI = 100
 
 
 DEFAULT_THEME: dict[str, Any] = {
@@ -66,75 +81,446 @@ def haversine_m(latitude1: float, longitude1: float, latitude2: float, longitude
     dphi = phi2 - phi1
     dlambda = math.radians(longitude2 - longitude1)
     a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-    return 2 * r * math.asin(min(1.0, math.sqrt(a)))
+    # atan2 form stays well-conditioned near antipodes; only rounding can push a past 1
+    return 2 * r * math.atan2(math.sqrt(a), math.sqrt(max(0.0, 1.0 - a)))
+
+
+def haversine_m_vec(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    # distances from one point to many, in a single pass over the arrays
+    r = 6371000.0
+    phi1 = np.radians(latitude)
+    phi2 = np.radians(latitudes)
+    dphi = phi2 - phi1
+    dlambda = np.radians(longitudes - longitude)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * r * np.arctan2(np.sqrt(a), np.sqrt(np.maximum(0.0, 1.0 - a)))
+
+
+def _unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    # points on the unit sphere, where chord length is monotonic in great-circle distance
+    phi = np.radians(latitudes)
+    lam = np.radians(longitudes)
+    cos_phi = np.cos(phi)
+    return np.column_stack((cos_phi * np.cos(lam), cos_phi * np.sin(lam), np.sin(phi)))
+
+
+def _chord_for_angle(angle: float) -> float:
+    return 2.0 * math.sin(min(math.pi, angle) / 2.0)
+
+
+def _cluster_kernel(latitudes: np.ndarray, longitudes: np.ndarray, min_distance_m: float):
+    # greedy nearest-centroid assignment over plain loops; compiled by numba when it is installed.
+    # centroids are bucketed in a hashed grid over unit-sphere vectors with cells one search chord
+    # wide, so a point only measures the centroids in the 27 cells around it. hash collisions just
+    # add candidates, and a centroid is re-bucketed whenever its running mean moves it.
+    r = 6371000.0
+    size = latitudes.shape[0]
+    clat = np.empty(size, dtype=np.float64)
+    clon = np.empty(size, dtype=np.float64)
+    cnt = np.empty(size, dtype=np.int64)
+    # per-centroid phi and cos(phi), refreshed only when a centroid moves
+    cphi = np.empty(size, dtype=np.float64)
+    ccos = np.empty(size, dtype=np.float64)
+
+    cell = 2.0 * math.sin(min(math.pi, min_distance_m / r) / 2.0) * (1.0 + 1e-6)
+    buckets = 1
+    while buckets < 2 * size:
+        buckets *= 2
+    mask = buckets - 1
+    # per-bucket doubly linked lists of centroid indices
+    head = np.full(buckets, -1, dtype=np.int64)
+    nxt = np.empty(size, dtype=np.int64)
+    prv = np.empty(size, dtype=np.int64)
+    cbucket = np.empty(size, dtype=np.int64)
+
+    n = 0
+    for i in range(size):
+        phi = math.radians(latitudes[i])
+        cos_phi = math.cos(phi)
+        lam = math.radians(longitudes[i])
+        gx = int(math.floor(cos_phi * math.cos(lam) / cell))
+        gy = int(math.floor(cos_phi * math.sin(lam) / cell))
+        gz = int(math.floor(math.sin(phi) / cell))
+        best = -1
+        best_d = math.inf
+        for ox in range(-1, 2):
+            for oy in range(-1, 2):
+                for oz in range(-1, 2):
+                    j = head[(((gx + ox) * 73856093) ^ ((gy + oy) * 19349663) ^ ((gz + oz) * 83492791)) & mask]
+                    while j >= 0:
+                        dphi = cphi[j] - phi
+                        dlambda = math.radians(clon[j] - longitudes[i])
+                        a = math.sin(dphi / 2) ** 2 + cos_phi * ccos[j] * math.sin(dlambda / 2) ** 2
+                        d = 2 * r * math.atan2(math.sqrt(a), math.sqrt(max(0.0, 1.0 - a)))
+                        # lowest index wins ties, as in a scan over every centroid
+                        if d < best_d or (d == best_d and j < best):
+                            best_d = d
+                            best = j
+                        j = nxt[j]
+
+        if best >= 0 and best_d <= min_distance_m:
+            count = cnt[best]
+            clat[best] = (clat[best] * count + latitudes[i]) / (count + 1)
+            clon[best] = (clon[best] * count + longitudes[i]) / (count + 1)
+            cnt[best] = count + 1
+            cphi[best] = math.radians(clat[best])
+            ccos[best] = math.cos(cphi[best])
+            c = best
+            lam = math.radians(clon[best])
+            gx = int(math.floor(ccos[best] * math.cos(lam) / cell))
+            gy = int(math.floor(ccos[best] * math.sin(lam) / cell))
+            gz = int(math.floor(math.sin(cphi[best]) / cell))
+            bucket = ((gx * 73856093) ^ (gy * 19349663) ^ (gz * 83492791)) & mask
+            if bucket == cbucket[c]:
+                continue
+            # unlink from the old bucket
+            if prv[c] >= 0:
+                nxt[prv[c]] = nxt[c]
+            else:
+                head[cbucket[c]] = nxt[c]
+            if nxt[c] >= 0:
+                prv[nxt[c]] = prv[c]
+        else:
+            clat[n] = latitudes[i]
+            clon[n] = longitudes[i]
+            cnt[n] = 1
+            cphi[n] = phi
+            ccos[n] = cos_phi
+            c = n
+            bucket = ((gx * 73856093) ^ (gy * 19349663) ^ (gz * 83492791)) & mask
+            n += 1
+
+        nxt[c] = head[bucket]
+        prv[c] = -1
+        if head[bucket] >= 0:
+            prv[head[bucket]] = c
+        head[bucket] = c
+        cbucket[c] = bucket
+    return clat[:n], clon[:n], cnt[:n]
+
+
+# importing numba and loading the cached kernel costs more than the cKDTree search saves
+# on small inputs, so only reach for it past this many points
+_NUMBA_MIN_POINTS = 10_000
+
+
+@functools.lru_cache(maxsize=None)
+def _cluster_njit():
+    try:
+        import numba
+    except ImportError:
+        # numba is optional; cluster_points falls back to the cKDTree search
+        return None
+    return numba.njit(cache=True)(_cluster_kernel)
 
 
 def cluster_points(
-    points: list[tuple[float, float]],
+    points: np.ndarray | list[tuple[float, float]],
     *,
     min_distance_m: float,
 ) -> list[tuple[float, float, int]]:
-    if not points:
+    coordinates = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(coordinates) == 0:
         return []
     if min_distance_m <= 0:
-        return [(latitute, longitude, 1) for (latitute, longitude) in points]
-
-    clusters: list[tuple[float, float, int]] = []
-    for latitute, longitude in points:
-        assigned = False
-        for index, (clat, clon, count) in enumerate(clusters):
-            if haversine_m(latitute, longitude, clat, clon) <= min_distance_m:
+        return [(latitute, longitude, 1) for (latitute, longitude) in coordinates.tolist()]
+
+    kernel = _cluster_njit() if len(coordinates) >= _NUMBA_MIN_POINTS else None
+    if kernel is not None:
+        clat, clon, cnt = kernel(
+            np.ascontiguousarray(coordinates[:, 0]),
+            np.ascontiguousarray(coordinates[:, 1]),
+            float(min_distance_m),
+        )
+        return list(zip(clat.tolist(), clon.tolist(), cnt.tolist()))
+
+    from scipy.spatial import cKDTree
+
+    xyz = _unit_vectors(coordinates[:, 0], coordinates[:, 1])
+    radius = min_distance_m / 6371000.0
+    rebuild_every = max(16, math.isqrt(len(coordinates)))
+
+    # centroids are kept as parallel (SoA) arrays so each point costs one vectorized distance call
+    clat_arr = np.empty(16, dtype=np.float64)
+    clon_arr = np.empty(16, dtype=np.float64)
+    cnt_arr = np.empty(16, dtype=np.int64)
+    n = 0
+
+    # centroids [0, indexed) live in the tree at their positions when it was built; they may
+    # have drifted since, so queries widen the search radius by the largest drift seen.
+    tree: cKDTree | None = None
+    built_lat = built_lon = clat_arr[:0]
+    indexed = 0
+    drift = 0.0
+
+    for i, (latitute, longitude) in enumerate(coordinates.tolist()):
+        if n and (tree is None or drift > radius or (n - indexed) >= rebuild_every):
+            built_lat = clat_arr[:n].copy()
+            built_lon = clon_arr[:n].copy()
+            tree = cKDTree(_unit_vectors(built_lat, built_lon))
+            indexed = n
+            drift = 0.0
+
+        if tree is not None:
+            near = tree.query_ball_point(xyz[i], _chord_for_angle(radius + drift) * (1 + 1e-9) + 1e-12)
+            candidates = np.concatenate((np.asarray(near, dtype=np.intp), np.arange(indexed, n)))
+        else:
+            candidates = np.arange(n)
+
+        if candidates.size:
+            d = haversine_m_vec(latitute, longitude, clat_arr[candidates], clon_arr[candidates])
+            best = int(np.argmin(d))
+            if d[best] <= min_distance_m:
+                index = int(candidates[best])
                 # update centroid as running mean
-                new_count = count + 1
-                new_lat = (clat * count + latitute) / new_count
-                new_lon = (clon * count + longitude) / new_count
-                clusters[index] = (new_lat, new_lon, new_count)
-                assigned = True
-                break
-        if not assigned:
-            clusters.append((latitute, longitude, 1))
-    return clusters
+                count = cnt_arr[index]
+                clat_arr[index] = (clat_arr[index] * count + latitute) / (count + 1)
+                clon_arr[index] = (clon_arr[index] * count + longitude) / (count + 1)
+                cnt_arr[index] = count + 1
+                if index < indexed:
+                    moved = haversine_m(built_lat[index], built_lon[index], clat_arr[index], clon_arr[index])
+                    drift = max(drift, moved / 6371000.0)
+                continue
+
+        if n == len(clat_arr):
+            clat_arr = np.resize(clat_arr, 2 * n)
+            clon_arr = np.resize(clon_arr, 2 * n)
+            cnt_arr = np.resize(cnt_arr, 2 * n)
+        clat_arr[n] = latitute
+        clon_arr[n] = longitude
+        cnt_arr[n] = 1
+        n += 1
+
+    return list(zip(clat_arr[:n].tolist(), clon_arr[:n].tolist(), cnt_arr[:n].tolist()))
 
 
-def _read_points_csv(path: str) -> list[tuple[float, float]]:
+def _read_points_csv(path: str) -> np.ndarray:
     p = Path(path)
     if not p.is_file():
         raise FileNotFoundError(f"Points file not found: {p}")
-    points: list[tuple[float, float]] = []
-    for raw in p.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        parts = [x.strip() for x in line.split(",")]
-        if len(parts) != 2:
-            raise ValueError(f"Invalid points line (expected 'latitute,longitude'): {raw!r}")
-        points.append((float(parts[0]), float(parts[1])))
-    return points
+    try:
+        with warnings.catch_warnings():
+            # a file holding only comments is a valid, empty point set
+            warnings.simplefilter("ignore", UserWarning)
+            points = np.loadtxt(p, delimiter=",", comments="#", dtype=np.float64, ndmin=2, encoding="utf-8")
+    except ValueError as e:
+        raise ValueError(f"Invalid points file (expected 'latitute,longitude' per line): {p}: {e}") from e
+    if points.size and points.shape[1] != 2:
+        raise ValueError(f"Invalid points file (expected 'latitute,longitude' per line): {p}")
+    # (N, 2) array of (latitute, longitude) rows; loadtxt accepts nan/inf, which have no place on
+    # the map (matplotlib never drew them), so drop them before the auto region and clustering
+    points = points.reshape(-1, 2)
+    return points[np.isfinite(points).all(axis=1)]
 
 
-def _auto_region_from_points(points: list[tuple[float, float]]) -> Region:
-    if not points:
-        return DEFAULT_WORLD_REGION.normalized()
+def _auto_region_from_points(points: np.ndarray) -> Region:
+    if len(points) == 0:
+        return DEFAULT_WORLD_REGION
 
-    latitutes = [p[0] for p in points]
-    longitudes = [p[1] for p in points]
-    latitude0, latitude1 = min(latitutes), max(latitutes)
-    longitude0, longitude1 = min(longitudes), max(longitudes)
+    latitude0, longitude0 = points.min(axis=0).tolist()
+    latitude1, longitude1 = points.max(axis=0).tolist()
 
     # if points span most of the globe, fall back to a global-ish region.
     if (longitude1 - longitude0) > 180:
-        return Region(-180.0, 180.0, max(-80.0, latitude0 - 5.0), min(80.0, latitude1 + 5.0)).normalized()
+        return Region(-180.0, 180.0, max(-80.0, latitude0 - 5.0), min(80.0, latitude1 + 5.0))
 
     lat_span = max(0.01, latitude1 - latitude0)
     lon_span = max(0.01, longitude1 - longitude0)
     latitude_padded = max(0.5, lat_span * 0.35)
     longitude_padded = max(0.5, lon_span * 0.35)
-    return Region(longitude0 - longitude_padded, longitude1 + longitude_padded, latitude0 - latitude_padded, latitude1 + latitude_padded).normalized()
+    return Region(longitude0 - longitude_padded, longitude1 + longitude_padded, latitude0 - latitude_padded, latitude1 + latitude_padded)
+
+
+# cartopy's auto_scaler thresholds: (scale, largest extent span in degrees it is used for)
+_NATURAL_EARTH_SCALES = (("50m", 50.0), ("10m", 15.0))
+
+
+def _natural_earth_scale(region: Region) -> str:
+    span = min(region.maximum_longitude - region.minimum_longitude, region.maximum_latitude - region.minimum_latitude)
+    scale = "110m"
+    for candidate, upper_bound in _NATURAL_EARTH_SCALES:
+        if span > upper_bound:
+            break
+        scale = candidate
+    return scale
+
+
+@functools.lru_cache(maxsize=None)
+def _natural_earth_index(category: str, name: str, scale: str):
+    # cartopy already keeps the geometries per process; only the spatial index is ours.
+    # the tree references cartopy's cached objects rather than copying them.
+    import cartopy.feature as cfeature
+    from shapely.strtree import STRtree
+
+    return STRtree(list(cfeature.NaturalEarthFeature(category, name, scale).geometries()))
+
+
+def _add_natural_earth(ax, feature, region: Region, **kwargs) -> None:
+    import cartopy.crs as ccrs
+    from shapely.geometry import box
+
+    scale = _natural_earth_scale(region)
+    index = _natural_earth_index(feature.category, feature.name, scale)
+    extent = box(region.minimum_longitude, region.minimum_latitude, region.maximum_longitude, region.maximum_latitude)
+    hits = sorted(index.query(extent, predicate="intersects"))
+    ax.add_geometries(list(index.geometries.take(hits)), ccrs.PlateCarree(), **{**feature.kwargs, **kwargs})
+
+
+def _add_base_map(ax, region: Region, theme: dict[str, Any]) -> None:
+    import cartopy.feature as cfeature
+
+    _add_natural_earth(ax, cfeature.LAND, region, facecolor=theme["landcolor"])
+    _add_natural_earth(ax, cfeature.OCEAN, region, facecolor=theme["oceancolor"])
+    _add_natural_earth(ax, cfeature.BORDERS, region, linewidth=0.5, edgecolor=theme["bordercolor"])
+    _add_natural_earth(ax, cfeature.COASTLINE, region, linewidth=0.5, edgecolor=theme["bordercolor"])
+
+
+def _add_inset_base_map(ax, region: Region, theme: dict[str, Any]) -> None:
+    import cartopy.feature as cfeature
+
+    _add_natural_earth(ax, cfeature.LAND, region, facecolor=theme["landcolor"])
+    _add_natural_earth(ax, cfeature.BORDERS, region, linewidth=0.25, edgecolor=theme.get("bordercolor", "black"))
+    _add_natural_earth(ax, cfeature.COASTLINE, region, linewidth=0.25, edgecolor=theme.get("bordercolor", "black"))
+    _add_natural_earth(ax, cfeature.RIVERS, region, linewidth=0.5, edgecolor=theme["watercolor"])
+    _add_natural_earth(ax, cfeature.OCEAN, region, linewidth=0.5, facecolor=theme["watercolor"])
+    _add_natural_earth(ax, cfeature.LAKES, region, linewidth=0.5, facecolor=theme["watercolor"])
+
+
+# bump whenever the cached pixels change for the same key (layers, styling, capture)
+_BASE_MAP_CACHE_VERSION = 2
+
+# past this total size the least recently used entries are evicted; per-photo insets are
+# rarely hit again, so without a bound the cache would grow with every render
+_BASE_MAP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _base_map_cache_path(fig, ax, region: Region, theme: dict[str, Any], layers: str) -> Path:
+    import matplotlib
+
+    window = _base_map_window(ax)
+    key = hashlib.sha1(
+        json.dumps(
+            {
+                "version": _BASE_MAP_CACHE_VERSION,
+                "layers": layers,
+                "region": region.as_extent(),
+                "theme": {k: theme.get(k) for k in ("landcolor", "oceancolor", "bordercolor", "watercolor")},
+                "dpi": fig.dpi,
+                "size": [fig.get_figwidth(), fig.get_figheight()],
+                "window": window,
+                "simplify": [matplotlib.rcParams["path.simplify"], matplotlib.rcParams["path.simplify_threshold"]],
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+    ).hexdigest()
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "locator" / f"base_{key}.png"
+
+
+def _base_map_window(ax) -> tuple[int, int, int, int]:
+    # whole display pixels covered by the axes
+    ax.apply_aspect()
+    x0, y0, x1, y1 = (int(round(v)) for v in ax.bbox.extents)
+    return x0, y0, x1, y1
+
+
+def _draw_cached_base_map(ax, path: Path) -> bool:
+    if not path.is_file():
+        return False
+
+    import matplotlib.pyplot as plt
+    from matplotlib.image import AxesImage
+
+    try:
+        image = plt.imread(path)
+    except (OSError, ValueError, SyntaxError):
+        # truncated or corrupt entry: drop it and let the caller redraw the base map
+        with contextlib.suppress(OSError):
+            path.unlink()
+        return False
+
+    # paste the pixels back in axes coordinates: going through a PlateCarree transform lets
+    # cartopy regrid the image, which it does when the window touches the +/-180 limits
+    x0, y0, x1, y1 = _base_map_window(ax)
+    (ax0, ay0), (ax1, ay1) = ax.transAxes.inverted().transform([(x0, y0), (x1, y1)])
+    cached = AxesImage(ax, origin="upper", interpolation="nearest", extent=(ax0, ax1, ay0, ay1), transform=ax.transAxes, zorder=0)
+    cached.set_data(image)
+    ax.add_image(cached)
+    # mark the entry as recently used for eviction
+    with contextlib.suppress(OSError):
+        os.utime(path)
+    return True
+
+
+def _add_cached_base_map(fig, ax, region: Region, theme: dict[str, Any], add_layers, out_path: str, cache: bool) -> bool:
+    # draws the base layers from the pixel cache when possible; returns whether the canvas was
+    # drawn to fill a cache miss. a hit pastes raster pixels into the axes, so vector outputs
+    # always get the real layers.
+    path = None
+    if cache and Path(out_path).suffix.lower() == ".png":
+        path = _base_map_cache_path(fig, ax, region, theme, add_layers.__name__)
+        if _draw_cached_base_map(ax, path):
+            return False
+
+    add_layers(ax, region, theme)
+    if path is None:
+        return False
+    _save_base_map(fig, ax, path)
+    return True
+
+
+def _save_base_map(fig, ax, path: Path) -> None:
+    # draws the canvas, which must hold only the base map layers; the frame is left out of the
+    # capture since it is drawn over the cached image anyway
+    import matplotlib.pyplot as plt
+
+    spine = ax.spines["geo"]
+    visible = spine.get_visible()
+    spine.set_visible(False)
+    try:
+        fig.canvas.draw()
+    finally:
+        spine.set_visible(visible)
+
+    x0, y0, x1, y1 = _base_map_window(ax)
+    rgba = np.asarray(fig.canvas.buffer_rgba())
+    height = rgba.shape[0]
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write next to the entry and rename into place, so readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.stem}.", suffix=".png", dir=path.parent)
+        os.close(fd)
+        try:
+            plt.imsave(tmp_name, rgba[height - y1:height - y0, x0:x1])
+            os.replace(tmp_name, path)
+        finally:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+        _prune_base_map_cache(path.parent)
+    except OSError:
+        # the cache is an optimization only; an unwritable cache dir must not fail the render
+        pass
+
+
+def _prune_base_map_cache(cache_dir: Path) -> None:
+    # evict by mtime, which hits refresh, until the cache fits in _BASE_MAP_CACHE_MAX_BYTES
+    entries = []
+    for entry in cache_dir.glob("base_*.png"):
+        with contextlib.suppress(OSError):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry))
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= _BASE_MAP_CACHE_MAX_BYTES:
+            break
+        with contextlib.suppress(OSError):
+            entry.unlink()
+        total -= size
 
 
 def render_summary_map(
     *,
-    points_lat_lon: list[tuple[float, float]],
+    points_lat_lon: np.ndarray,
     min_distance_m: float,
     caption: str | None,
     world_region: Region | None,
@@ -143,11 +529,15 @@ def render_summary_map(
     dpi: int,
     fig_width_in: float,
     show: bool,
+    base_cache: bool = True,
 ) -> None:
+    import cartopy.crs as ccrs
+    import matplotlib.pyplot as plt
+
     proj = ccrs.PlateCarree()
 
-    world_region = (world_region or _auto_region_from_points(points_lat_lon)).normalized()
-    aspect_main = geographic_aspect(world_region)
+    world_region = world_region or _auto_region_from_points(points_lat_lon)
+    aspect_main = projected_aspect(world_region)
     fig_h = fig_width_in * aspect_main
     fig = plt.figure(figsize=(fig_width_in, fig_h), dpi=dpi)
     fig.patch.set_facecolor(str(theme.get("oceancolor", DEFAULT_THEME["oceancolor"])))
@@ -155,17 +545,25 @@ def render_summary_map(
 
     ax = fig.add_axes([0, 0, 1, 1], projection=proj)
     ax.set_extent(world_region.as_extent())
-    ax.add_feature(cfeature.LAND, facecolor=theme["landcolor"])
-    ax.add_feature(cfeature.OCEAN, facecolor=theme["oceancolor"])
-    ax.add_feature(cfeature.BORDERS, linewidth=0.5, edgecolor=theme["bordercolor"])
-    ax.add_feature(cfeature.COASTLINE, linewidth=0.5, edgecolor=theme["bordercolor"])
-    ax.set_aspect("equal", adjustable="box")
+    _add_cached_base_map(fig, ax, world_region, theme, _add_base_map, out_path, base_cache)
 
     clusters = cluster_points(points_lat_lon, min_distance_m=min_distance_m)
-    for latitute, longitude, count in clusters:
+    if clusters:
+        latitutes, longitudes, counts = (np.asarray(column, dtype=np.float64) for column in zip(*clusters))
         # slightly scale star size for clusters, but keep it subtle.
-        ms = 7.0 + min(6.0, 1.5 * math.log10(max(1, count)))
-        ax.plot(longitude, latitute, marker="*", color=theme["starcolor"], markersize=ms, transform=proj, zorder=6)
+        ms = 7.0 + np.minimum(6.0, 1.5 * np.log10(np.maximum(1, counts)))
+        # one collection for every star rather than an artist per cluster
+        ax.scatter(
+            longitudes,
+            latitutes,
+            s=ms ** 2,
+            marker="*",
+            color=theme["starcolor"],
+            linewidths=1.0,
+            transform=proj,
+            zorder=6,
+            rasterized=True,
+        )
 
     if caption:
         ax.text(
@@ -181,25 +579,29 @@ def render_summary_map(
             zorder=10,
         )
 
-    plt.savefig(
-        out_path,
-        bbox_inches="tight",
-        pad_inches=0,
-        dpi=dpi,
-        facecolor=fig.get_facecolor(),
-        edgecolor="none",
-    )
+    _save_figure(fig, out_path, dpi)
     if show:
         plt.show()
+    plt.close(fig)
 
 
-def geographic_aspect(region: Region) -> float:
-    region = region.normalized()
-    mean_latitude = (region.minimum_latitude + region.maximum_latitude) / 2
-    denominator = (region.maximum_longitude - region.minimum_longitude) * math.cos(math.radians(mean_latitude))
-    if denominator == 0:
+@functools.lru_cache(maxsize=64)
+def projected_aspect(region: Region) -> float:
+    # cartopy keeps PlateCarree axes at equal aspect, so this is the height/width the map is drawn at
+    width = region.maximum_longitude - region.minimum_longitude
+    if width == 0:
         return 1.0
-    return (region.maximum_latitude - region.minimum_latitude) / denominator
+    return (region.maximum_latitude - region.minimum_latitude) / width
+
+
+def _save_figure(fig, out_path: str, dpi: int) -> None:
+    # figures are sized to the projected map, so the axes already fill the canvas and no
+    # bbox_inches="tight" pre-render is needed
+    kwargs: dict[str, Any] = {}
+    if Path(out_path).suffix.lower() == ".png":
+        # flat-colour maps barely grow at a fast zlib level, but encode several times faster
+        kwargs["pil_kwargs"] = {"compress_level": 1}
+    fig.savefig(out_path, dpi=dpi, facecolor=fig.get_facecolor(), edgecolor="none", **kwargs)
 
 
 def _float_list(values: Iterable[str], count: int, name: str) -> list[float]:
@@ -214,7 +616,7 @@ def _float_list(values: Iterable[str], count: int, name: str) -> list[float]:
 
 def parse_region(values: list[str]) -> Region:
     minimum_longitude, maximum_longitude, minimum_latitude, maximum_latitude = _float_list(values, 4, "region")
-    return Region(minimum_longitude, maximum_longitude, minimum_latitude, maximum_latitude).normalized()
+    return Region(minimum_longitude, maximum_longitude, minimum_latitude, maximum_latitude)
 
 
 def parse_coordinates(values: list[str]) -> tuple[float, float]:
@@ -239,7 +641,8 @@ def load_theme(theme_path: str | None) -> dict[str, Any]:
     return theme
 
 
-def _add_svg_badge(ax, svg_path: str, size_px: int, xy_axes: tuple[float, float]) -> None:
+@functools.lru_cache(maxsize=8)
+def _decode_svg(svg_path: str, size_px: int) -> np.ndarray:
     try:
         import cairosvg
         from PIL import Image
@@ -251,17 +654,22 @@ def _add_svg_badge(ax, svg_path: str, size_px: int, xy_axes: tuple[float, float]
 
     svg_bytes = Path(svg_path).read_bytes()
     png_bytes = cairosvg.svg2png(bytestring=svg_bytes, output_width=size_px, output_height=size_px)
-    image = Image.open(io.BytesIO(png_bytes)).convert("RGBA")
-    offset = OffsetImage(image, zoom=0.2)
-    ab = AnnotationBbox(
-        offset,
-        xy_axes,
-        xycoords=ax.transAxes,
-        frameon=False,
-        box_alignment=(1, 0),
-        zorder=10,
-    )
-    ax.add_artist(ab)
+    image = np.array(Image.open(io.BytesIO(png_bytes)).convert("RGBA"))
+    # shared between callers through the cache
+    image.setflags(write=False)
+    return image
+
+
+def _add_svg_badge(ax, svg_path: str, size_px: int, xy_axes: tuple[float, float]) -> None:
+    image = _decode_svg(str(svg_path), int(size_px))
+
+    # drawn at 0.2x the rasterized size in points, bottom-right corner anchored at xy_axes
+    scale = 0.2 * ax.figure.dpi / 72.0
+    width = image.shape[1] * scale / max(1.0, ax.bbox.width)
+    height = image.shape[0] * scale / max(1.0, ax.bbox.height)
+    badge_ax = ax.inset_axes([xy_axes[0] - width, xy_axes[1], width, height], zorder=10)
+    badge_ax.set_axis_off()
+    badge_ax.imshow(image, aspect="auto")
 
 
 def _clamp(value: float, low: float, high: float) -> float:
@@ -311,9 +719,10 @@ def _rect_distance_sq(
     return dx * dx + dy * dy
 
 
-def _data_to_fig(fig, ax, x: float, y: float) -> tuple[float, float]:
-    x_disp, y_disp = ax.transData.transform((x, y))
-    return fig.transFigure.inverted().transform((x_disp, y_disp))
+def _data_to_fig(fig, ax, points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    # one pass through the projection + affine pipeline for all points
+    display = ax.transData.transform(np.asarray(points, dtype=np.float64).reshape(-1, 2))
+    return [tuple(p) for p in fig.transFigure.inverted().transform(display).tolist()]
 
 
 def _segments_intersect(a: tuple[float, float], b: tuple[float, float], c: tuple[float, float], d: tuple[float, float]) -> bool:
@@ -348,14 +757,11 @@ def _best_connector_pairs(fig, ax_main, ax_inset, zoom_region: Region) -> list[t
         (zoom_region.maximum_longitude, zoom_region.maximum_latitude),  # tr
         (zoom_region.minimum_longitude, zoom_region.maximum_latitude),  # tl
     ]
-    zoom_fig = [_data_to_fig(fig, ax_main, x, y) for (x, y) in zoom_data]
+    zoom_fig = _data_to_fig(fig, ax_main, zoom_data)
 
     inset_axes = [(0, 0), (1, 0), (1, 1), (0, 1)]  # bl, br, tr, tl
-    inset_fig: list[tuple[float, float]] = []
-    for xa, ya in inset_axes:
-        xd, yd = ax_inset.transAxes.transform((xa, ya))
-        xf, yf = fig.transFigure.inverted().transform((xd, yd))
-        inset_fig.append((xf, yf))
+    inset_disp = ax_inset.transAxes.transform(np.asarray(inset_axes, dtype=np.float64))
+    inset_fig = [tuple(p) for p in fig.transFigure.inverted().transform(inset_disp).tolist()]
 
     best_perm: tuple[int, int, int, int] | None = None
     best_key = (10**9, float("inf"))  # (crossings, total_distance_sq)
@@ -386,10 +792,8 @@ def _best_connector_pairs(fig, ax_main, ax_inset, zoom_region: Region) -> list[t
 
 def _pick_inset_position(
     *,
-    fig,
-    ax_main,
-    star_lon: float,
-    star_lat: float,
+    star_x: float,
+    star_y: float,
     inset_size: float,
     inset_margin: float,
     bounds_xmin: float,
@@ -409,9 +813,6 @@ def _pick_inset_position(
     max_size = max(0.08, max_size)
     size = min(inset_size, max_size)
 
-    x_disp, y_disp = ax_main.transData.transform((star_lon, star_lat))
-    star_x, star_y = fig.transFigure.inverted().transform((x_disp, y_disp))
-
     star_pad = 0.02
     gap = max(0.002, inset_margin * 0.6)
     min_clearance = max(gap, 0.008, max(0.0, min_gap_fig))
@@ -545,10 +946,8 @@ def _pick_inset_position(
 
 def _pick_inset_position_corner_snap(
     *,
-    fig,
-    ax_main,
-    star_lon: float,
-    star_lat: float,
+    star_x: float,
+    star_y: float,
     inset_size: float,
     inset_margin: float,
     bounds_xmin: float,
@@ -570,9 +969,6 @@ def _pick_inset_position_corner_snap(
 
     min_clearance = max(0.0, min_gap_fig)
 
-    x_disp, y_disp = ax_main.transData.transform((star_lon, star_lat))
-    star_x, star_y = fig.transFigure.inverted().transform((x_disp, y_disp))
-
     star_pad = 0.02
     usable_xmin = bounds_xmin + inset_margin
     usable_xmax = bounds_xmax - inset_margin
@@ -640,6 +1036,22 @@ def _pick_inset_position_corner_snap(
     return fallback_best[0], fallback_best[1], size
 
 
+def _fit_aspect_in_slot(fig, x0: float, y0: float, size: float, aspect: float) -> list[float]:
+    # largest box of the given height/width ratio centred in a size x size figure-fraction slot,
+    # i.e. where an equal-aspect axes would shrink itself to at draw time
+    width_px = max(1.0, fig.get_figwidth() * fig.dpi)
+    height_px = max(1.0, fig.get_figheight() * fig.dpi)
+    slot_w = size * width_px
+    slot_h = size * height_px
+    if aspect * slot_w <= slot_h:
+        box_w, box_h = slot_w, slot_w * aspect
+    else:
+        box_w, box_h = slot_h / aspect, slot_h
+    w = box_w / width_px
+    h = box_h / height_px
+    return [x0 + (size - w) * 0.5, y0 + (size - h) * 0.5, w, h]
+
+
 def _expand_world_for_zoom(
     world_region: Region,
     zoom_region: Region,
@@ -647,20 +1059,17 @@ def _expand_world_for_zoom(
     edge_buffer_frac: float = 0.06,
     min_buffer_deg: float = 0.03,
 ) -> Region:
-    world = world_region.normalized()
-    zoom = zoom_region.normalized()
-
-    lon_span = max(0.01, world.maximum_longitude - world.minimum_longitude)
-    lat_span = max(0.01, world.maximum_latitude - world.minimum_latitude)
+    lon_span = max(0.01, world_region.maximum_longitude - world_region.minimum_longitude)
+    lat_span = max(0.01, world_region.maximum_latitude - world_region.minimum_latitude)
     lon_buf = max(min_buffer_deg, lon_span * edge_buffer_frac)
     lat_buf = max(min_buffer_deg, lat_span * edge_buffer_frac)
 
     return Region(
-        min(world.minimum_longitude, zoom.minimum_longitude - lon_buf),
-        max(world.maximum_longitude, zoom.maximum_longitude + lon_buf),
-        min(world.minimum_latitude, zoom.minimum_latitude - lat_buf),
-        max(world.maximum_latitude, zoom.maximum_latitude + lat_buf),
-    ).normalized()
+        min(world_region.minimum_longitude, zoom_region.minimum_longitude - lon_buf),
+        max(world_region.maximum_longitude, zoom_region.maximum_longitude + lon_buf),
+        min(world_region.minimum_latitude, zoom_region.minimum_latitude - lat_buf),
+        max(world_region.maximum_latitude, zoom_region.maximum_latitude + lat_buf),
+    )
 
 
 def render_map(
@@ -679,11 +1088,14 @@ def render_map(
     show: bool,
     clock_size_px: int,
     inset_placement_mode: str = "smart",
+    base_cache: bool = True,
 ) -> None:
+    import cartopy.crs as ccrs
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import ConnectionPatch, Rectangle
+
     proj = ccrs.PlateCarree()
 
-    world_region = world_region.normalized()
-    zoom_region = zoom_region.normalized()
     world_region = _expand_world_for_zoom(world_region, zoom_region)
 
     star_lat, star_lon = star_lat_lon
@@ -691,7 +1103,7 @@ def render_map(
     inset_size = float(theme.get("inset_size", DEFAULT_THEME["inset_size"]))
     inset_margin = float(theme.get("inset_margin", DEFAULT_THEME["inset_margin"]))
 
-    aspect_main = geographic_aspect(world_region)
+    aspect_main = projected_aspect(world_region)
     fig_h = fig_width_in * aspect_main
     fig = plt.figure(figsize=(fig_width_in, fig_h), dpi=dpi)
     fig.patch.set_facecolor(str(theme.get("oceancolor", DEFAULT_THEME["oceancolor"])))
@@ -699,11 +1111,9 @@ def render_map(
 
     ax_main = fig.add_axes([0, 0, 1, 1], projection=proj)
     ax_main.set_extent(world_region.as_extent())
-    ax_main.add_feature(cfeature.LAND, facecolor=theme["landcolor"])
-    ax_main.add_feature(cfeature.OCEAN, facecolor=theme["oceancolor"])
-    ax_main.add_feature(cfeature.BORDERS, linewidth=0.5, edgecolor=theme["bordercolor"])
-    ax_main.add_feature(cfeature.COASTLINE, linewidth=0.5, edgecolor=theme["bordercolor"])
-    ax_main.set_aspect("equal", adjustable="box")
+    # layout below reads the drawn transforms; filling the base map cache has already drawn the canvas
+    if not _add_cached_base_map(fig, ax_main, world_region, theme, _add_base_map, out_path, base_cache):
+        fig.canvas.draw()
 
     ax_main.plot(
         star_lon,
@@ -715,27 +1125,29 @@ def render_map(
         zorder=7,
     )
 
-    fig.canvas.draw()
-
-    # inset bounds in figure coordinates
-    wx0, wy0 = _data_to_fig(fig, ax_main, world_region.minimum_longitude, world_region.minimum_latitude)
-    wx1, wy1 = _data_to_fig(fig, ax_main, world_region.maximum_longitude, world_region.maximum_latitude)
+    # star, inset bounds and zoom source data in figure coordinates
+    (star_x, star_y), (wx0, wy0), (wx1, wy1), (rx0, ry0), (rx1, ry1) = _data_to_fig(
+        fig,
+        ax_main,
+        [
+            (star_lon, star_lat),
+            (world_region.minimum_longitude, world_region.minimum_latitude),
+            (world_region.maximum_longitude, world_region.maximum_latitude),
+            (zoom_region.minimum_longitude, zoom_region.minimum_latitude),
+            (zoom_region.maximum_longitude, zoom_region.maximum_latitude),
+        ],
+    )
     map_xmin, map_xmax = min(wx0, wx1), max(wx0, wx1)
     map_ymin, map_ymax = min(wy0, wy1), max(wy0, wy1)
 
-    # zoom source data in figure coordinates
-    rx0, ry0 = _data_to_fig(fig, ax_main, zoom_region.minimum_longitude, zoom_region.minimum_latitude)
-    rx1, ry1 = _data_to_fig(fig, ax_main, zoom_region.maximum_longitude, zoom_region.maximum_latitude)
     rect_xmin, rect_xmax = min(rx0, rx1), max(rx0, rx1)
     rect_ymin, rect_ymax = min(ry0, ry1), max(ry0, ry1)
 
     mode = str(inset_placement_mode).strip().lower()
     if mode == "corner-snap":
         x0, y0, inset_size = _pick_inset_position_corner_snap(
-            fig=fig,
-            ax_main=ax_main,
-            star_lon=star_lon,
-            star_lat=star_lat,
+            star_x=star_x,
+            star_y=star_y,
             inset_size=inset_size,
             inset_margin=inset_margin,
             bounds_xmin=map_xmin,
@@ -749,10 +1161,8 @@ def render_map(
         )
     else:
         x0, y0, inset_size = _pick_inset_position(
-            fig=fig,
-            ax_main=ax_main,
-            star_lon=star_lon,
-            star_lat=star_lat,
+            star_x=star_x,
+            star_y=star_y,
             inset_size=inset_size,
             inset_margin=inset_margin,
             bounds_xmin=map_xmin,
@@ -765,7 +1175,7 @@ def render_map(
             rect_ymax=rect_ymax,
         )
 
-    ax_inset = fig.add_axes([x0, y0, inset_size, inset_size], projection=proj, zorder=5)
+    ax_inset = fig.add_axes(_fit_aspect_in_slot(fig, x0, y0, inset_size, projected_aspect(zoom_region)), projection=proj, zorder=5)
     
     inset_edge = str(theme.get("insetcolor", DEFAULT_THEME["insetcolor"]))
     if "geo" in ax_inset.spines:
@@ -777,12 +1187,7 @@ def render_map(
             spine.set_linewidth(0.9)
 
     ax_inset.set_extent(zoom_region.as_extent())
-    ax_inset.add_feature(cfeature.LAND, facecolor=theme["landcolor"])
-    ax_inset.add_feature(cfeature.BORDERS, linewidth=0.25, edgecolor=theme.get("bordercolor", "black"))
-    ax_inset.add_feature(cfeature.COASTLINE, linewidth=0.25, edgecolor=theme.get("bordercolor", "black"))
-    ax_inset.add_feature(cfeature.RIVERS, linewidth=0.5, edgecolor=theme["watercolor"])
-    ax_inset.add_feature(cfeature.OCEAN, linewidth=0.5, facecolor=theme["watercolor"])
-    ax_inset.add_feature(cfeature.LAKES, linewidth=0.5, facecolor=theme["watercolor"])
+    _add_cached_base_map(fig, ax_inset, zoom_region, theme, _add_inset_base_map, out_path, base_cache)
     ax_inset.plot(star_lon, star_lat, marker="*", color=theme["starcolor"], markersize=9, transform=proj, zorder=5)
 
     ax_inset.text(
@@ -846,20 +1251,23 @@ def render_map(
         )
         fig.add_artist(connection)
 
-    plt.savefig(
-        out_path,
-        bbox_inches="tight",
-        pad_inches=0,
-        dpi=dpi,
-        facecolor=fig.get_facecolor(),
-        edgecolor="none",
-    )
+    _save_figure(fig, out_path, dpi)
     if show:
         plt.show()
+    plt.close(fig)
 
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Render a locator map with an inset zoom window.")
+    p.add_argument(
+        "--batch",
+        default=None,
+        help=(
+            "JSON file listing render jobs, each an object of option names to values "
+            "(e.g. {\"summary-points\": \"pts.csv\", \"out\": \"a.png\"}). "
+            "Jobs run in parallel without preview windows; other options are ignored."
+        ),
+    )
     p.add_argument(
         "--summary-points",
         default=None,
@@ -914,16 +1322,87 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--clock-size", type=int, default=64, help="Clock badge size in pixels.")
     p.add_argument("--out", default="locator_map_styled.png", help="Output image path.")
     p.add_argument("--dpi", type=int, default=300, help="Output DPI.")
+    p.add_argument(
+        "--draft",
+        action="store_true",
+        help=f"Fast preview: render at {DRAFT_DPI} DPI (overrides --dpi) with aggressive path simplification.",
+    )
     p.add_argument("--fig-width", type=float, default=8.0, help="Figure width in inches.")
     p.add_argument("--no-show", action="store_true", help="Do not open a preview window.")
+    p.add_argument(
+        "--no-base-cache",
+        action="store_true",
+        help="Do not read or write the cached base map layer (~/.cache/locator).",
+    )
     return p
 
 
-def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
+def _job_argv(job: dict[str, Any]) -> list[str]:
+    argv: list[str] = []
+    for key, value in job.items():
+        option = "--" + str(key).lstrip("-").replace("_", "-")
+        if value is True:
+            argv.append(option)
+        elif value is False or value is None:
+            continue
+        elif isinstance(value, list):
+            argv.append(option)
+            argv.extend(str(v) for v in value)
+        else:
+            argv.extend((option, str(value)))
+    if "--no-show" not in argv:
+        argv.append("--no-show")
+    return argv
+
+
+def load_batch(batch_path: str) -> list[list[str]]:
+    p = Path(batch_path)
+    if not p.is_file():
+        raise FileNotFoundError(f"Batch file not found: {p}")
 
-    theme = load_theme(args.theme_file)
+    data = json.loads(p.read_text(encoding="utf-8"))
+    if not isinstance(data, list) or not all(isinstance(job, dict) for job in data):
+        raise ValueError("Batch JSON must be a list of job objects (dictionaries).")
+    if any("batch" in job for job in data):
+        raise ValueError("Batch jobs cannot themselves use --batch.")
+
+    return [_job_argv(job) for job in data]
+
+
+def _worker_init() -> None:
+    # pay the plotting-stack import once per worker instead of once per job; Natural Earth
+    # geometries then stay cached in the worker across the jobs it runs.
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import cartopy.crs  # noqa: F401
+    import cartopy.feature  # noqa: F401
+    import matplotlib.pyplot  # noqa: F401
 
+
+def run_batch(batch_path: str) -> int:
+    jobs = load_batch(batch_path)
+    if not jobs:
+        return 0
+
+    status = 0
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init) as pool:
+        futures = [pool.submit(main, argv) for argv in jobs]
+        for index, future in enumerate(futures):
+            try:
+                status = max(status, future.result())
+            except SystemExit as e:
+                # argparse rejected the job's options; it has already printed why
+                print(f"Batch job {index} exited with status {e.code}", file=sys.stderr)
+                status = 1
+            except Exception as e:
+                print(f"Batch job {index} failed: {e}", file=sys.stderr)
+                status = 1
+    return status
+
+
+def _render_from_args(args: argparse.Namespace, theme: dict[str, Any]) -> int:
     # summary comprises a single zoomed-out map containing all points
     if args.summary_points:
         points = _read_points_csv(args.summary_points)
@@ -944,6 +1423,7 @@ def main(argv: list[str] | None = None) -> int:
             dpi=args.dpi,
             fig_width_in=args.fig_width,
             show=not args.no_show,
+            base_cache=not args.no_base_cache,
         )
         return 0
 
@@ -966,9 +1446,35 @@ def main(argv: list[str] | None = None) -> int:
         show=not args.no_show,
         clock_size_px=args.clock_size,
         inset_placement_mode=args.inset_placement,
+        base_cache=not args.no_base_cache,
     )
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.batch:
+        return run_batch(args.batch)
+
+    theme = load_theme(args.theme_file)
+
+    import matplotlib
+
+    if args.no_show:
+        # nothing is displayed, so skip importing a GUI backend
+        matplotlib.use("Agg")
+
+    rc: dict[str, Any] = {}
+    if args.draft:
+        # ~9x fewer pixels than the 300 DPI default, and let Agg decimate coastline vertices
+        rc = {"path.simplify": True, "path.simplify_threshold": 1.0}
+        args.dpi = DRAFT_DPI
+
+    # scoped to this render, so draft settings never leak into later batch jobs in a worker
+    with matplotlib.rc_context(rc):
+        return _render_from_args(args, theme)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("cartopy")
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+import snapshot
+
+
+def _render_summary(points, out_path, base_cache):
+    snapshot.render_summary_map(
+        points_lat_lon=points,
+        min_distance_m=1000.0,
+        caption=None,
+        world_region=None,
+        theme=dict(snapshot.DEFAULT_THEME),
+        out_path=str(out_path),
+        dpi=50,
+        fig_width_in=8.0,
+        show=False,
+        base_cache=base_cache,
+    )
+    return plt.imread(out_path)
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        # spans more than 180 degrees of longitude, so the map falls back to the full -180..180 width
+        np.array([[50.0, -120.0], [40.0, 10.0], [-30.0, 120.0]]),
+        np.array([[53.3, -6.2], [51.9, -8.5], [54.6, -5.9]]),
+    ],
+)
+def test_base_map_cache_hit_matches_miss(tmp_path, monkeypatch, points):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    uncached = _render_summary(points, tmp_path / "uncached.png", base_cache=False)
+    miss = _render_summary(points, tmp_path / "miss.png", base_cache=True)
+    assert list((tmp_path / "cache" / "locator").glob("base_*.png"))
+    hit = _render_summary(points, tmp_path / "hit.png", base_cache=True)
+
+    np.testing.assert_array_equal(miss, uncached)
+    np.testing.assert_array_equal(hit, uncached)